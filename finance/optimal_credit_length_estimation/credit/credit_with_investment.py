@@ -1,42 +1,79 @@
-from typing import Dict, Any
-from detail.investment import calculate_simple_investment
+from typing import Dict, Any, Optional, Sequence
 
+import numpy as np
 
-def calculate_credit_with_investment(credit_results: Dict[int, Dict[str, float]], credit_parameters: Dict[str, Any]) -> Dict[int, Dict[str, float]]:
+from credit.simple_credit import YearResult
+
+
+def calculate_credit_with_investment(
+    credit_results: Dict[int, Dict[str, float]],
+    credit_parameters: Dict[str, Any],
+    years: Optional[Sequence[int]] = None,
+) -> Dict[int, YearResult]:
     """Calculate credit results with investment of payment difference
-    
+
     Args:
         credit_results (dict): Results from calculate_credit function
         credit_parameters (dict): Credit parameters containing acceptable payment, investment rate, and inflation
-    
+        years (sequence, optional): Restrict the calculation to these loan terms;
+            all terms present in credit_results are used by default
+
     Returns:
         dict: Modified results with investment calculations
     """
+    if years is not None:
+        credit_results = {year: credit_results[year] for year in years}
+
     acceptable_monthly_payment = credit_parameters["Acceptable monthly payment"][0]
     investment_rate = credit_parameters["Investment interest rate"][0]
     inflation_rate = credit_parameters["Expected inflation"][0]
-    
-    results = {}
-    
-    for years, data in credit_results.items():
-        actual_monthly_payment = max(acceptable_monthly_payment, data['monthly_payment'])
-        monthly_investment = max(0, acceptable_monthly_payment - data['monthly_payment'])
-        
-        investment_balance = calculate_simple_investment(
-            0, monthly_investment, investment_rate, years
-        )
-        
-        total_cost_with_investment = data['total_cost'] - investment_balance
-        
-        # Calculate inflation-adjusted total cost
-        inflation_factor = (1 + inflation_rate / 100) ** years
-        total_cost_adjusted_with_investment = total_cost_with_investment / inflation_factor
-        
-        results[years] = {
-            'monthly_payment': actual_monthly_payment,
-            'total_cost': total_cost_with_investment,
-            'total_cost_adjusted': round(total_cost_adjusted_with_investment, 2),
-            'investment_balance': round(investment_balance, 2)
+
+    count = len(credit_results)
+    years = np.fromiter(credit_results.keys(), dtype=np.int64, count=count)
+    monthly_payment = np.fromiter(
+        (data["monthly_payment"] for data in credit_results.values()),
+        dtype=np.float64,
+        count=count,
+    )
+    total_cost = np.fromiter(
+        (data["total_cost"] for data in credit_results.values()),
+        dtype=np.float64,
+        count=count,
+    )
+
+    actual_monthly_payment = np.maximum(acceptable_monthly_payment, monthly_payment)
+    monthly_investment = np.maximum(0, acceptable_monthly_payment - monthly_payment)
+
+    # Closed-form future value of the monthly contributions for all terms
+    monthly_rate = investment_rate / 100 / 12
+    months = years * 12
+    if monthly_rate == 0:
+        investment_balance = monthly_investment * months
+    else:
+        factor = (1 + monthly_rate) ** months
+        investment_balance = monthly_investment * (factor - 1) / monthly_rate
+    investment_balance = np.round(investment_balance, 2)
+
+    total_cost_with_investment = total_cost - investment_balance
+
+    # Calculate inflation-adjusted total costs
+    inflation_factors = (1 + inflation_rate / 100) ** years
+    total_cost_adjusted_with_investment = np.round(
+        total_cost_with_investment / inflation_factors, 2
+    )
+
+    return {
+        year: {
+            'monthly_payment': payment,
+            'total_cost': cost,
+            'total_cost_adjusted': cost_adjusted,
+            'investment_balance': balance
         }
-    
-    return results
\ No newline at end of file
+        for year, payment, cost, cost_adjusted, balance in zip(
+            years.tolist(),
+            actual_monthly_payment.tolist(),
+            total_cost_with_investment.tolist(),
+            total_cost_adjusted_with_investment.tolist(),
+            investment_balance.tolist(),
+        )
+    }
@@ -1,58 +1,382 @@
-from typing import Dict, Any
+import math
+from functools import lru_cache
+from typing import Dict, Any, NotRequired, Optional, Tuple, TypedDict
 
+import numpy as np
 
-def _calculate_monthly_payment(amount: float, rate: float, months: int) -> float:
-    """Calculate monthly payment for given loan parameters"""
+# Structure-of-arrays layout for per-term credit results: one row per loan term
+CREDIT_RESULT_DTYPE = np.dtype(
+    [
+        ("monthly_payment", "f8"),
+        ("total_cost", "f8"),
+        ("total_cost_adjusted", "f8"),
+        ("investment_balance", "f8"),
+    ]
+)
+
+
+# Percent-to-decimal conversions as multiplications; one FP multiply instead
+# of the two (or one) divisions in the x / 100 / 12 chains
+_INV_1200 = 1.0 / 1200.0
+_INV_100 = 1.0 / 100.0
+
+
+class YearResult(TypedDict):
+    """Per-term result record produced by the credit calculators
+
+    investment_balance and actual_months only appear in the variants that
+    compute them.
+    """
+    monthly_payment: float
+    total_cost: float
+    total_cost_adjusted: float
+    investment_balance: NotRequired[float]
+    actual_months: NotRequired[int]
+
+
+def _calculate_payoff_with_overpayment(
+    amount: float, rate: float, payment: float, max_months: int
+) -> Tuple[int, float]:
+    """Calculate payoff time and total paid for a fixed payment, returning (months, total paid)
+
+    Uses the closed-form annuity payoff formula instead of simulating the
+    amortization month by month.
+    """
+    if rate == 0:
+        actual_months = math.ceil(amount / payment)
+    elif payment <= amount * rate:
+        # Payment does not cover the interest, the credit is never paid off
+        return max_months, payment * max_months
+    else:
+        actual_months = math.ceil(
+            -math.log1p(-rate * amount / payment) / math.log1p(rate)
+        )
+
+    actual_months = min(actual_months, max_months)
+    return actual_months, payment * actual_months
+
+
+def _inflation_factors(inflation_rate: float) -> np.ndarray:
+    """Compound inflation factors (1 + rate)**years for every loan term (3-30 years)"""
+    base = 1 + inflation_rate
+    # Running product instead of 28 independent pow() calls
+    return np.cumprod(np.full(28, base)) * base**2
+
+
+@lru_cache(maxsize=128)
+def precompute_rate_factors(
+    rate_pct: float, inflation_pct: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Amount-independent per-term factors for scalar rate parameters
+
+    Returns read-only arrays (payment_factors, inflation_factors) such that
+    monthly_payment = amount * payment_factors for every loan term. Callers
+    sweeping the credit amount for a fixed rate/inflation pair can reuse the
+    factors and pay one multiply per term per amount.
+    """
+    rate = rate_pct * _INV_1200  # Convert to monthly decimal rate
+
+    months = np.arange(3, 31) * 12
+
+    # Calculate payment factors for all terms at once. The rate is a scalar
+    # per call, so a scalar branch avoids materializing both np.where arms.
+    # Since consecutive terms differ by 12 months, the rate factors form a
+    # running product of a single (1 + rate)**12 step instead of 28
+    # independent pow() calls
     if rate == 0:
-        return amount / months
+        payment_factors = 1.0 / months
+    else:
+        step = (1 + rate) ** 12
+        rate_factor = np.cumprod(np.full(28, step)) * step**2
+        payment_factors = rate * rate_factor / (rate_factor - 1)
+
+    inflation_factors = _inflation_factors(inflation_pct * _INV_100)
+
+    payment_factors.setflags(write=False)
+    inflation_factors.setflags(write=False)
+
+    return payment_factors, inflation_factors
+
+
+@lru_cache(maxsize=128)
+def _credit_table(
+    amount: float, rate_pct: float, inflation_pct: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute and memoize the credit table for scalar credit parameters
+
+    Returns a read-only structured array with CREDIT_RESULT_DTYPE rows (one
+    per loan term) plus the per-term inflation factors, so repeated calls
+    with the same parameters skip the numeric work entirely.
+    """
+    payment_factors, inflation_factors = precompute_rate_factors(
+        rate_pct, inflation_pct
+    )
+    months = np.arange(3, 31) * 12
+
+    # The amount-dependent part is a scalar-times-array multiply
+    monthly_payment = amount * payment_factors
+    total_cost = monthly_payment * months
+    total_cost_adjusted = total_cost / inflation_factors
+
+    # The table keeps full-precision values; rounding happens once at the
+    # dict-building boundary in calculate_credit
+    table = np.empty(28, dtype=CREDIT_RESULT_DTYPE)
+    table["monthly_payment"] = monthly_payment
+    table["total_cost"] = total_cost
+    table["total_cost_adjusted"] = total_cost_adjusted
+    table["investment_balance"] = 0.0
+
+    table.setflags(write=False)
+
+    return table, inflation_factors
+
+
+def calculate_credit_table(
+    credit_parameters: Dict[str, Any],
+    investment_parameters: Optional[Dict[str, Any]] = None,
+) -> np.ndarray:
+    """Calculates the credit table as a structured NumPy array
+
+    Structure-of-arrays counterpart of calculate_credit: one CREDIT_RESULT_DTYPE
+    row per loan term (3-30 years), holding full-precision values (rounding to
+    cents is left to the presentation layer). The array is read-only and shared
+    between calls, and vectorized consumers can e.g. find the optimal term with
+    table["total_cost_adjusted"].argmin() + 3.
+
+    Args:
+        credit_parameters (dict): Contains "Credit amount", "Credit rate", "Expected inflation"
+        investment_parameters (dict, optional): Contains "Acceptable monthly payment"
+            and "Investment interest rate"; when given, the payment difference is
+            invested and the returned table carries the adjusted costs and balances
+
+    Returns:
+        np.ndarray: Read-only structured array with one row per loan term
+    """
+    table, inflation_factors = _credit_table(
+        credit_parameters["Credit amount"],
+        credit_parameters["Credit rate"][0],
+        credit_parameters["Expected inflation"][0],
+    )
+    if investment_parameters is None:
+        return table
+
+    acceptable_payment = investment_parameters["Acceptable monthly payment"][0]
+    investment_rate = investment_parameters["Investment interest rate"][0]
+
+    monthly_payment = table["monthly_payment"]
+    monthly_investment = np.maximum(0, acceptable_payment - monthly_payment)
+
+    # Full-precision future values of the invested payment difference
+    monthly_rate = investment_rate * _INV_1200
+    months = np.arange(3, 31) * 12
+    if monthly_rate == 0:
+        investment_balance = monthly_investment * months
+    else:
+        factor = (1 + monthly_rate) ** months
+        investment_balance = monthly_investment * (factor - 1) / monthly_rate
+
+    adjusted = np.empty(28, dtype=CREDIT_RESULT_DTYPE)
+    adjusted["monthly_payment"] = np.maximum(acceptable_payment, monthly_payment)
+    adjusted["total_cost"] = table["total_cost"] - investment_balance
+    adjusted["total_cost_adjusted"] = adjusted["total_cost"] / inflation_factors
+    adjusted["investment_balance"] = investment_balance
+
+    adjusted.setflags(write=False)
+
+    return adjusted
+
+
+def calculate_credit_scalar(
+    amount: float, rate_pct: float, inflation_pct: float
+) -> np.ndarray:
+    """Scalar-argument variant of calculate_credit_table
+
+    Skips the parameter-dict unpacking and list indexing for callers that
+    already hold plain scalars; repeated calls hit the same memoized table.
+
+    Args:
+        amount (float): Credit amount
+        rate_pct (float): Annual credit rate as percentage
+        inflation_pct (float): Expected annual inflation as percentage
+
+    Returns:
+        np.ndarray: Read-only structured array with one row per loan term
+    """
+    table, _ = _credit_table(amount, rate_pct, inflation_pct)
+    return table
+
 
-    rate_factor = (1 + rate) ** months
-    numerator = rate * rate_factor
-    denominator = rate_factor - 1
-    return amount * (numerator / denominator)
+def calculate_credit_batch(
+    amounts: Any, rates: Any, inflations: Any
+) -> np.ndarray:
+    """Evaluates many (amount, rate, inflation) scenarios in one NumPy call
 
+    Broadcasts the annuity formula over the scenario and loan-term axes so
+    sensitivity or Monte-Carlo sweeps pay one ufunc dispatch instead of one
+    calculate_credit call per scenario.
 
-def calculate_credit(credit_parameters: Dict[str, Any]) -> Dict[int, Dict[str, float]]:
+    Args:
+        amounts: Credit amounts, one per scenario
+        rates: Annual credit rates as percentages, one per scenario
+        inflations: Expected annual inflations as percentages, one per scenario
+
+    Returns:
+        np.ndarray: Structured array of shape (scenarios, 28) with
+            CREDIT_RESULT_DTYPE rows holding full-precision values
+    """
+    amounts = np.asarray(amounts, dtype=np.float64)[:, None]
+    rates = np.asarray(rates, dtype=np.float64)[:, None] * _INV_1200
+    inflations = np.asarray(inflations, dtype=np.float64)[:, None] * _INV_100
+
+    years = np.arange(3, 31)
+    months = years * 12
+
+    rate_factor = (1 + rates) ** months
+    with np.errstate(divide="ignore", invalid="ignore"):
+        monthly_payment = np.where(
+            rates == 0,
+            amounts / months,
+            amounts * rates * rate_factor / (rate_factor - 1),
+        )
+
+    total_cost = monthly_payment * months
+    total_cost_adjusted = total_cost / (1 + inflations) ** years
+
+    table = np.empty(monthly_payment.shape, dtype=CREDIT_RESULT_DTYPE)
+    table["monthly_payment"] = monthly_payment
+    table["total_cost"] = total_cost
+    table["total_cost_adjusted"] = total_cost_adjusted
+    table["investment_balance"] = 0.0
+
+    return table
+
+
+def calculate_credit_grid(credit_parameters: Dict[str, Any]) -> np.ndarray:
+    """Evaluates every rate/inflation combination against all loan terms
+
+    The input format already allows several entries under "Credit rate" and
+    "Expected inflation"; this sweeps their full Cartesian product in one
+    broadcasted pass instead of one calculate_credit call per combination.
+
+    Args:
+        credit_parameters (dict): Contains "Credit amount", "Credit rate",
+            "Expected inflation"
+
+    Returns:
+        np.ndarray: Structured array of shape (n_rates, n_inflations, 28)
+            with CREDIT_RESULT_DTYPE rows holding full-precision values
+    """
+    rates = np.asarray(credit_parameters["Credit rate"], dtype=np.float64)
+    inflations = np.asarray(credit_parameters["Expected inflation"], dtype=np.float64)
+
+    rate_grid, inflation_grid = np.meshgrid(rates, inflations, indexing="ij")
+    amounts = np.full(
+        rate_grid.size, credit_parameters["Credit amount"], dtype=np.float64
+    )
+    table = calculate_credit_batch(amounts, rate_grid.ravel(), inflation_grid.ravel())
+    return table.reshape(rates.size, inflations.size, -1)
+
+
+def _investment_balances(
+    monthly_investment: np.ndarray,
+    interest_rate: float,
+    months: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Future values of monthly contributions, by default one per loan term (3-30 years)
+
+    Vectorized equivalent of calculate_simple_investment(0, monthly, rate, years).
+    """
+    monthly_rate = interest_rate * _INV_1200
+    if months is None:
+        months = np.arange(3, 31) * 12
+
+    if monthly_rate == 0:
+        return np.round(monthly_investment * months, 2)
+
+    factor = (1 + monthly_rate) ** months
+    return np.round(monthly_investment * (factor - 1) / monthly_rate, 2)
+
+
+def calculate_credit(
+    credit_parameters: Dict[str, Any],
+    investment_parameters: Optional[Dict[str, Any]] = None,
+) -> Dict[int, YearResult]:
     """Calculates credit payments for different loan terms. Additionally calculates total credit cost adjusted to inflation in "today's" money
 
     Args:
         credit_parameters (dict): Contains "Credit amount", "Credit rate", "Expected inflation"
+        investment_parameters (dict, optional): Contains "Acceptable monthly payment"
+            and "Investment interest rate". When given, the difference between the
+            acceptable and the required payment is invested in the same pass,
+            fusing calculate_credit and calculate_credit_with_investment into a
+            single sweep over the loan terms
 
     Returns:
         dict: Results for each year (3-30) with monthly payment and total cost
     """
-    amount = credit_parameters["Credit amount"]
-    rate = (
-        credit_parameters["Credit rate"][0] / 100 / 12
-    )  # Convert to monthly decimal rate
-    inflation_rate = (
-        credit_parameters["Expected inflation"][0] / 100
-    )  # Annual inflation rate
-
-    results = {}
-    for years in range(3, 31):
-        months = years * 12
-
-        # Calculate monthly payment
-        monthly_payment = _calculate_monthly_payment(amount, rate, months)
-
-        total_cost = monthly_payment * months
-
-        # Calculate inflation-adjusted total cost
-        inflation_factor = (1 + inflation_rate) ** years
-        total_cost_adjusted = total_cost / inflation_factor
-
-        results[years] = {
-            "monthly_payment": round(monthly_payment, 2),
-            "total_cost": round(total_cost, 2),
-            "total_cost_adjusted": round(total_cost_adjusted, 2),
-            "investment_balance": 0,
+    table, inflation_factors = _credit_table(
+        credit_parameters["Credit amount"],
+        credit_parameters["Credit rate"][0],
+        credit_parameters["Expected inflation"][0],
+    )
+    # Round to cents once, at the presentation boundary
+    monthly_payment, total_cost, total_cost_adjusted = np.round(
+        np.stack(
+            (
+                table["monthly_payment"],
+                table["total_cost"],
+                table["total_cost_adjusted"],
+            )
+        ),
+        2,
+    )
+    years = np.arange(3, 31)
+
+    if investment_parameters is None:
+        return {
+            year: {
+                "monthly_payment": mp,
+                "total_cost": tc,
+                "total_cost_adjusted": tca,
+                "investment_balance": 0,
+            }
+            for year, mp, tc, tca in zip(
+                years.tolist(),
+                monthly_payment.tolist(),
+                total_cost.tolist(),
+                total_cost_adjusted.tolist(),
+            )
         }
 
-    return results
+    # Invest the payment difference in the same pass over the loan terms
+    acceptable_payment = investment_parameters["Acceptable monthly payment"][0]
+    investment_rate = investment_parameters["Investment interest rate"][0]
 
+    actual_payment = np.maximum(acceptable_payment, monthly_payment)
+    monthly_investment = np.maximum(0, acceptable_payment - monthly_payment)
+    investment_balance = _investment_balances(monthly_investment, investment_rate)
 
-def calculate_credit_with_overpayment(credit_parameters: Dict[str, Any]) -> Dict[int, Dict[str, float]]:
+    total_cost_with_investment = total_cost - investment_balance
+    total_cost_adjusted_with_investment = total_cost_with_investment / inflation_factors
+
+    return {
+        year: {
+            "monthly_payment": mp,
+            "total_cost": tc,
+            "total_cost_adjusted": tca,
+            "investment_balance": ib,
+        }
+        for year, mp, tc, tca, ib in zip(
+            years.tolist(),
+            actual_payment.tolist(),
+            total_cost_with_investment.tolist(),
+            np.round(total_cost_adjusted_with_investment, 2).tolist(),
+            investment_balance.tolist(),
+        )
+    }
+
+
+def calculate_credit_with_overpayment(credit_parameters: Dict[str, Any]) -> Dict[int, YearResult]:
     """Calculates credit with overpayment when monthly payment is below acceptable threshold
     
     Args:
@@ -61,79 +385,109 @@ def calculate_credit_with_overpayment(credit_parameters: Dict[str, Any]) -> Dict
     Returns:
         dict: Results for each year (3-30) with actual payment time and costs
     """
-    amount = credit_parameters["Credit amount"]
-    rate = credit_parameters["Credit rate"][0] / 100 / 12
-    inflation_rate = credit_parameters["Expected inflation"][0] / 100
-    acceptable_payment = credit_parameters["Acceptable monthly payment"][0]
-    
-    results = {}
-    for years in range(3, 31):
-        months = years * 12
-        
-        # Calculate standard monthly payment
-        standard_payment = _calculate_monthly_payment(amount, rate, months)
-        
-        if standard_payment >= acceptable_payment:
-            # No overpayment possible
-            total_cost = standard_payment * months
-            inflation_factor = (1 + inflation_rate) ** years
-            total_cost_adjusted = total_cost / inflation_factor
-            
-            results[years] = {
-                "monthly_payment": round(standard_payment, 2),
-                "total_cost": round(total_cost, 2),
-                "total_cost_adjusted": round(total_cost_adjusted, 2),
-                "investment_balance": 0,
-                "actual_months": months
-            }
+    investment_rates = credit_parameters.get("Investment interest rate")
+    rows = _overpayment_rows(
+        credit_parameters["Credit amount"],
+        credit_parameters["Credit rate"][0],
+        credit_parameters["Expected inflation"][0],
+        credit_parameters["Acceptable monthly payment"][0],
+        investment_rates[0] if investment_rates else None,
+    )
+
+    return {
+        years: {
+            "monthly_payment": monthly_payment,
+            "total_cost": total_cost,
+            "total_cost_adjusted": total_cost_adjusted,
+            "investment_balance": investment_balance,
+            "actual_months": actual_months,
+        }
+        for (
+            years,
+            monthly_payment,
+            total_cost,
+            total_cost_adjusted,
+            investment_balance,
+            actual_months,
+        ) in rows
+    }
+
+
+@lru_cache(maxsize=128)
+def _overpayment_rows(
+    amount: float,
+    rate_pct: float,
+    inflation_pct: float,
+    acceptable_payment: float,
+    investment_rate: Optional[float],
+) -> Tuple[Tuple[int, float, float, float, float, int], ...]:
+    """Compute and memoize per-term overpayment rows for scalar parameters
+
+    The whole 28-term sweep is computed with masked NumPy operations; the two
+    branches (standard payment vs overpayment) are split by a boolean mask
+    instead of branching per year.
+    """
+    rate = rate_pct * _INV_1200
+
+    # The standard payments and costs are shared with calculate_credit
+    # through the memoized base table
+    table, inflation_factors = _credit_table(amount, rate_pct, inflation_pct)
+    standard_payment = table["monthly_payment"]
+    standard_cost = table["total_cost"]
+
+    years = np.arange(3, 31)
+    months = years * 12
+
+    overpayment_possible = standard_payment < acceptable_payment
+
+    if not overpayment_possible.any():
+        # No overpayment possible for any term
+        monthly_payment = standard_payment
+        total_cost = standard_cost
+        investment_balance = np.zeros(28)
+        actual_months = months
+    else:
+        # The payoff time with the fixed acceptable payment does not depend on
+        # the term, only the clamp to the full term does
+        payoff_months, _ = _calculate_payoff_with_overpayment(
+            amount, rate, acceptable_payment, 360
+        )
+        actual_payoff_months = np.minimum(payoff_months, months)
+        total_paid = acceptable_payment * actual_payoff_months
+
+        # Invest the payment for the months remaining after the payoff
+        remaining_months = months - actual_payoff_months
+        if (overpayment_possible & (remaining_months > 0)).any():
+            if investment_rate is None:
+                raise KeyError("Investment interest rate")
+            investment_balance_overpaid = _investment_balances(
+                acceptable_payment, investment_rate, months=remaining_months
+            )
         else:
-            # Calculate with overpayment
-            overpayment = acceptable_payment - standard_payment
-            actual_payment = acceptable_payment
-            
-            # Calculate actual payoff time with overpayment
-            remaining_balance = amount
-            actual_months = 0
-            total_paid = 0
-            
-            while remaining_balance > 0.01 and actual_months < months:
-                interest_payment = remaining_balance * rate
-                principal_payment = actual_payment - interest_payment
-                
-                if principal_payment <= 0:
-                    break
-                    
-                remaining_balance -= principal_payment
-                total_paid += actual_payment
-                actual_months += 1
-            
-            # Calculate investment balance for remaining months after payoff
-            remaining_months = months - actual_months
-            if remaining_months > 0:
-                from detail.investment import calculate_simple_investment
-                investment_rate = credit_parameters["Investment interest rate"][0]
-                investment_balance = calculate_simple_investment(
-                    0,
-                    acceptable_payment,
-                    investment_rate,
-                    remaining_months / 12
-                )
-            else:
-                investment_balance = 0
-            
-            # Calculate total cost with investment balance subtracted
-            total_cost_with_investment = total_paid - investment_balance
-            
-            # Calculate inflation-adjusted total cost using the new total cost and full loan term
-            inflation_factor = (1 + inflation_rate) ** years
-            total_cost_adjusted = total_cost_with_investment / inflation_factor
-            
-            results[years] = {
-                "monthly_payment": round(actual_payment, 2),
-                "total_cost": round(total_cost_with_investment, 2),
-                "total_cost_adjusted": round(total_cost_adjusted, 2),
-                "investment_balance": round(investment_balance, 2),
-                "actual_months": actual_months
-            }
-    
-    return results
+            investment_balance_overpaid = np.zeros(28)
+
+        monthly_payment = np.where(
+            overpayment_possible, float(acceptable_payment), standard_payment
+        )
+        total_cost = np.where(
+            overpayment_possible,
+            total_paid - investment_balance_overpaid,
+            standard_cost,
+        )
+        investment_balance = np.where(
+            overpayment_possible, investment_balance_overpaid, 0.0
+        )
+        actual_months = np.where(overpayment_possible, actual_payoff_months, months)
+
+    total_cost_adjusted = total_cost / inflation_factors
+
+    return tuple(
+        zip(
+            years.tolist(),
+            np.round(monthly_payment, 2).tolist(),
+            np.round(total_cost, 2).tolist(),
+            np.round(total_cost_adjusted, 2).tolist(),
+            investment_balance.tolist(),
+            actual_months.tolist(),
+        )
+    )
@@ -1,32 +1,63 @@
+import os
 import unittest
+from operator import itemgetter
+import numpy as np
 from credit.credit_with_investment import calculate_credit_with_investment
 from credit.simple_credit import calculate_credit
+from detail.investment import calculate_simple_investment
+
+
+# Full term coverage by default; set FAST_TESTS=1 to sample the boundary
+# terms only during tight edit-test loops
+_YEARS = (3, 15, 30) if os.getenv("FAST_TESTS") else tuple(range(3, 31))
+
+
+def _field(results, name):
+    """Extract one field from every per-term record as a float array"""
+    return np.fromiter(
+        map(itemgetter(name), results.values()), dtype=np.float64, count=len(results)
+    )
 
 
 class TestCreditWithInvestment(unittest.TestCase):
     
-    def setUp(self):
-        self.credit_parameters = {
+    @classmethod
+    def setUpClass(cls):
+        # Shared read-only baseline, computed once for the whole class
+        # instead of once per test method
+        cls.credit_parameters = {
             "Credit amount": 100000,
             "Credit rate": [5.0],
             "Expected inflation": [3.0]
         }
-        self.credit_results = calculate_credit(self.credit_parameters)
-        self.acceptable_payment = 1000
-        self.investment_rate = 7.0
-        self.inflation_rate = 3.0
+        cls.credit_results = calculate_credit(cls.credit_parameters)
+        cls.acceptable_payment = 1000
+        cls.investment_rate = 7.0
+        cls.inflation_rate = 3.0
+        # Several tests use this exact parameter set; compute it once
+        cls.default_params = {
+            "Acceptable monthly payment": [cls.acceptable_payment],
+            "Investment interest rate": [cls.investment_rate],
+            "Expected inflation": [cls.inflation_rate]
+        }
+        cls.default_results = calculate_credit_with_investment(cls.credit_results, cls.default_params)
+        # Independently computed balances for cross-checking the default scenario
+        cls.expected_balances = {
+            years: calculate_simple_investment(
+                0, max(0, cls.acceptable_payment - data['monthly_payment']),
+                cls.investment_rate, years
+            )
+            for years, data in cls.credit_results.items()
+        }
     
     def test_monthly_payment_never_below_credit(self):
         """Test that monthly payment is never below required credit payment"""
-        test_params = {
-            "Acceptable monthly payment": [self.acceptable_payment],
-            "Investment interest rate": [self.investment_rate],
-            "Expected inflation": [self.inflation_rate]
-        }
-        results = calculate_credit_with_investment(self.credit_results, test_params)
-        
-        for years, data in results.items():
-            self.assertGreaterEqual(data['monthly_payment'], self.credit_results[years]['monthly_payment'])
+        results = self.default_results
+
+        payments = _field(results, 'monthly_payment')
+        baseline = _field(self.credit_results, 'monthly_payment')
+        # assert_array_less is strict, so shift by a hair to allow equality
+        np.testing.assert_array_less(baseline - 1e-9, payments)
     
     def test_low_acceptable_payment(self):
         """Test that when acceptable payment is too low, credit payment is used"""
@@ -38,26 +69,21 @@ class TestCreditWithInvestment(unittest.TestCase):
         results = calculate_credit_with_investment(self.credit_results, test_params)
         
         # Monthly payment should equal credit payment (no investment possible)
-        for years, data in results.items():
-            self.assertEqual(data['monthly_payment'], self.credit_results[years]['monthly_payment'])
-            self.assertEqual(data['total_cost'], self.credit_results[years]['total_cost'])
+        for field in ('monthly_payment', 'total_cost'):
+            got = _field(results, field)
+            expected = _field(self.credit_results, field)
+            np.testing.assert_array_equal(got, expected, err_msg=field)
     
     def test_total_cost_reduction(self):
         """Test that total cost is reduced when investment is possible"""
-        test_params = {
-            "Acceptable monthly payment": [self.acceptable_payment],
-            "Investment interest rate": [self.investment_rate],
-            "Expected inflation": [self.inflation_rate]
-        }
-        results = calculate_credit_with_investment(self.credit_results, test_params)
-        
+        results = self.default_results
+
         # Find a case where investment is possible
+        baseline = self.credit_results
         for years in [10, 15, 20]:
-            if self.credit_results[years]['monthly_payment'] < self.acceptable_payment:
-                self.assertLess(
-                    results[years]['total_cost'],
-                    self.credit_results[years]['total_cost']
-                )
+            base = baseline[years]
+            if base['monthly_payment'] < self.acceptable_payment:
+                self.assertLess(results[years]['total_cost'], base['total_cost'])
     
     def test_zero_investment_rate(self):
         """Test with zero investment rate"""
@@ -68,49 +94,38 @@ class TestCreditWithInvestment(unittest.TestCase):
         }
         results = calculate_credit_with_investment(self.credit_results, test_params)
         
-        for years, data in results.items():
-            expected_payment = max(self.acceptable_payment, self.credit_results[years]['monthly_payment'])
-            self.assertEqual(data['monthly_payment'], expected_payment)
+        payments = _field(results, 'monthly_payment')
+        baseline = _field(self.credit_results, 'monthly_payment')
+        expected = np.maximum(self.acceptable_payment, baseline)
+        np.testing.assert_array_equal(payments, expected)
     
     def test_exact_payment_match(self):
         """Test when acceptable payment exactly matches credit payment"""
-        exact_payment = self.credit_results[10]['monthly_payment']
+        base = self.credit_results[10]
+        exact_payment = base['monthly_payment']
         test_params = {
             "Acceptable monthly payment": [exact_payment],
             "Investment interest rate": [self.investment_rate],
             "Expected inflation": [self.inflation_rate]
         }
-        results = calculate_credit_with_investment(self.credit_results, test_params)
-        
+        results = calculate_credit_with_investment(self.credit_results, test_params, years=[10])
+
         # Monthly payment and total cost should be unchanged for this term
         self.assertEqual(results[10]['monthly_payment'], exact_payment)
-        self.assertEqual(
-            results[10]['total_cost'],
-            self.credit_results[10]['total_cost']
-        )
-        self.assertEqual(
-            results[10]['total_cost_adjusted'],
-            self.credit_results[10]['total_cost_adjusted']
-        )
+        self.assertEqual(results[10]['total_cost'], base['total_cost'])
+        self.assertEqual(results[10]['total_cost_adjusted'], base['total_cost_adjusted'])
     
     def test_inflation_adjustment_calculation(self):
         """Test that inflation adjustment is calculated correctly"""
-        test_params = {
-            "Acceptable monthly payment": [self.acceptable_payment],
-            "Investment interest rate": [self.investment_rate],
-            "Expected inflation": [self.inflation_rate]
-        }
-        results = calculate_credit_with_investment(self.credit_results, test_params)
-        
+        results = self.default_results
+
         # Test specific case where we can verify calculation
         years = 10
-        if self.credit_results[years]['monthly_payment'] < self.acceptable_payment:
-            # Calculate expected values manually
-            monthly_investment = self.acceptable_payment - self.credit_results[years]['monthly_payment']
-            investment_balance = calculate_simple_investment(
-                0, monthly_investment, self.investment_rate, years
-            )
-            expected_total_cost = self.credit_results[years]['total_cost'] - investment_balance
+        base = self.credit_results[years]
+        if base['monthly_payment'] < self.acceptable_payment:
+            # Expected values from the independently precomputed balance table
+            investment_balance = self.expected_balances[years]
+            expected_total_cost = base['total_cost'] - investment_balance
             inflation_factor = (1 + self.inflation_rate / 100) ** years
             expected_adjusted_cost = round(expected_total_cost / inflation_factor, 2)
             
@@ -126,25 +141,23 @@ class TestCreditWithInvestment(unittest.TestCase):
         results = calculate_credit_with_investment(self.credit_results, test_params)
         
         # With zero inflation, adjusted cost should equal nominal cost
-        for years, data in results.items():
-            self.assertAlmostEqual(data['total_cost_adjusted'], data['total_cost'], places=2)
+        adjusted = _field(results, 'total_cost_adjusted')
+        nominal = _field(results, 'total_cost')
+        np.testing.assert_allclose(adjusted, nominal, atol=0.005)
     
     def test_inflation_adjustment_reduces_cost(self):
         """Test that inflation adjustment reduces the adjusted cost when cost is positive"""
-        test_params = {
-            "Acceptable monthly payment": [self.acceptable_payment],
-            "Investment interest rate": [self.investment_rate],
-            "Expected inflation": [self.inflation_rate]
-        }
-        results = calculate_credit_with_investment(self.credit_results, test_params)
-        
+        results = self.default_results
+
         # For positive costs, adjusted cost should be less than nominal cost
         # For negative costs (profit), adjusted cost should be greater than nominal cost
-        for years, data in results.items():
-            if years > 1 and data['total_cost'] > 0:
-                self.assertLess(data['total_cost_adjusted'], data['total_cost'])
-            elif years > 1 and data['total_cost'] < 0:
-                self.assertGreater(data['total_cost_adjusted'], data['total_cost'])
+        for years in _YEARS:
+            data = results[years]
+            with self.subTest(years=years):
+                if years > 1 and data['total_cost'] > 0:
+                    self.assertLess(data['total_cost_adjusted'], data['total_cost'])
+                elif years > 1 and data['total_cost'] < 0:
+                    self.assertGreater(data['total_cost_adjusted'], data['total_cost'])
 
 
 if __name__ == '__main__':
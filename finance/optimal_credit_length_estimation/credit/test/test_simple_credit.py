@@ -1,6 +1,45 @@
 import unittest
-import math
-from ..simple_credit import calculate_credit, calculate_credit_with_overpayment
+from collections import ChainMap
+from functools import lru_cache
+from types import MappingProxyType
+
+import numpy as np
+
+from ..credit_with_investment import calculate_credit_with_investment
+from ..simple_credit import (
+    calculate_credit,
+    calculate_credit_batch,
+    calculate_credit_grid,
+    calculate_credit_scalar,
+    calculate_credit_table,
+    calculate_credit_with_overpayment,
+    precompute_rate_factors,
+)
+
+# Shared immutable defaults; tests override keys through ChainMap views
+_DEFAULT_OVERPAYMENT_PARAMS = MappingProxyType({
+    "Credit amount": 100000,
+    "Credit rate": [5.0],
+    "Expected inflation": [2.0],
+    "Acceptable monthly payment": [1000],
+    "Investment interest rate": [4.0]
+})
+
+
+def _override(base, overrides):
+    """A read view of base with some keys replaced, without copying it"""
+    return ChainMap(overrides, base)
+
+
+def _cents(value):
+    """Integer cents, for exact comparison of monetary values"""
+    return int(round(value * 100))
+
+
+@lru_cache(maxsize=None)
+def _infl_factor(rate_pct, years):
+    """Cached (1 + rate/100) ** years factor for expected-value math"""
+    return (1 + rate_pct / 100) ** years
 
 
 class TestSimpleCreditCalculation(unittest.TestCase):
@@ -47,10 +86,10 @@ class TestSimpleCreditCalculation(unittest.TestCase):
 
         result_10y = results[10]
         # With 3% inflation over 10 years, adjusted cost should be lower
-        inflation_factor = (1 + 0.03) ** 10
+        inflation_factor = _infl_factor(3.0, 10)
         expected_adjusted = result_10y["total_cost"] / inflation_factor
-        self.assertAlmostEqual(
-            result_10y["total_cost_adjusted"], expected_adjusted, places=2
+        self.assertEqual(
+            _cents(result_10y["total_cost_adjusted"]), _cents(expected_adjusted)
         )
 
     def test_all_years_present(self):
@@ -99,42 +138,154 @@ class TestSimpleCreditCalculation(unittest.TestCase):
         )
 
 
-class TestCreditWithOverpayment(unittest.TestCase):
-    
-    def setUp(self):
-        self.test_params = {
+class TestCreditArrayApi(unittest.TestCase):
+    """Tests for the structured-array calculators against the scalar path"""
+
+    # Scenarios exercising the masked branches: a regular rate, a zero rate
+    # and a zero inflation
+    scenarios = (
+        (250000, 5.5, 2.5),
+        (100000, 0.0, 3.0),
+        (100000, 6.0, 0.0),
+    )
+
+    def test_batch_matches_scalar(self):
+        """Test that the broadcasted batch rows equal the scalar tables"""
+        amounts, rates, inflations = zip(*self.scenarios)
+        batch = calculate_credit_batch(amounts, rates, inflations)
+        self.assertEqual(batch.shape, (len(self.scenarios), 28))
+
+        for row, scenario in zip(batch, self.scenarios):
+            scalar_table = calculate_credit_scalar(*scenario)
+            for field in scalar_table.dtype.names:
+                with self.subTest(scenario=scenario, field=field):
+                    np.testing.assert_allclose(
+                        row[field], scalar_table[field], rtol=1e-10
+                    )
+
+    def test_grid_matches_scalar(self):
+        """Test that every grid cell equals the matching scalar table"""
+        params = {
             "Credit amount": 100000,
-            "Credit rate": [5.0],
-            "Expected inflation": [2.0],
-            "Acceptable monthly payment": [1000],
-            "Investment interest rate": [4.0]
+            "Credit rate": [0.0, 4.0, 7.5],
+            "Expected inflation": [0.0, 2.0],
+        }
+        grid = calculate_credit_grid(params)
+        self.assertEqual(grid.shape, (3, 2, 28))
+
+        for i, rate in enumerate(params["Credit rate"]):
+            for j, inflation in enumerate(params["Expected inflation"]):
+                scalar_table = calculate_credit_scalar(100000, rate, inflation)
+                for field in scalar_table.dtype.names:
+                    with self.subTest(rate=rate, inflation=inflation, field=field):
+                        np.testing.assert_allclose(
+                            grid[i, j][field], scalar_table[field], rtol=1e-10
+                        )
+
+    def test_table_matches_credit_dict(self):
+        """Test that the rounded table equals the calculate_credit records"""
+        params = {
+            "Credit amount": 250000,
+            "Credit rate": [5.5],
+            "Expected inflation": [2.5],
+        }
+        table = calculate_credit_table(params)
+        results = calculate_credit(params)
+
+        for field in ("monthly_payment", "total_cost", "total_cost_adjusted"):
+            with self.subTest(field=field):
+                np.testing.assert_array_equal(
+                    np.round(table[field], 2),
+                    [data[field] for data in results.values()],
+                )
+
+    def test_table_investment_branch_consistent(self):
+        """Test the invested table against its own base table"""
+        params = {
+            "Credit amount": 250000,
+            "Credit rate": [5.5],
+            "Expected inflation": [2.5],
         }
+        investment_params = {
+            "Acceptable monthly payment": [3000],
+            "Investment interest rate": [4.0],
+        }
+        base = calculate_credit_table(params)
+        adjusted = calculate_credit_table(params, investment_params)
+
+        acceptable_payment = investment_params["Acceptable monthly payment"][0]
+        np.testing.assert_array_equal(
+            adjusted["monthly_payment"],
+            np.maximum(acceptable_payment, base["monthly_payment"]),
+        )
+        np.testing.assert_allclose(
+            adjusted["total_cost"],
+            base["total_cost"] - adjusted["investment_balance"],
+            rtol=1e-12,
+        )
+        # The balance only accrues where the payment leaves room to invest
+        investable = base["monthly_payment"] < acceptable_payment
+        np.testing.assert_array_equal(
+            adjusted["investment_balance"] > 0, investable
+        )
+
+    def test_precomputed_factors_match_scalar(self):
+        """Test that amount * payment_factors reproduces the scalar payments"""
+        payment_factors, _ = precompute_rate_factors(5.5, 2.5)
+        self.assertFalse(payment_factors.flags.writeable)
+        np.testing.assert_array_equal(
+            250000 * payment_factors,
+            calculate_credit_scalar(250000, 5.5, 2.5)["monthly_payment"],
+        )
+
+    def test_fused_investment_matches_two_step(self):
+        """Test that the fused investment path equals the two-step calculation"""
+        params = {
+            "Credit amount": 250000,
+            "Credit rate": [5.5],
+            "Expected inflation": [2.5],
+        }
+        investment_params = {
+            "Acceptable monthly payment": [3000],
+            "Investment interest rate": [4.0],
+        }
+        fused = calculate_credit(params, investment_parameters=investment_params)
+        two_step = calculate_credit_with_investment(
+            calculate_credit(params), {**params, **investment_params}
+        )
+        self.assertEqual(fused, two_step)
+
+
+class TestCreditWithOverpayment(unittest.TestCase):
+    
+    test_params = _DEFAULT_OVERPAYMENT_PARAMS
     
     def test_no_overpayment_scenario(self):
         """Test when acceptable payment is lower than required payment"""
-        params = self.test_params.copy()
-        params["Acceptable monthly payment"] = [500]
-        
+        params = _override(self.test_params, {"Acceptable monthly payment": [500]})
+
         results = calculate_credit_with_overpayment(params)
         
         # Should have results for all years
         self.assertEqual(len(results), 28)
         
-        # Check that actual_months field is present
-        for year, data in results.items():
-            self.assertIn("actual_months", data)
-            self.assertIn("monthly_payment", data)
-            self.assertIn("total_cost", data)
-            self.assertIn("total_cost_adjusted", data)
-            self.assertIn("investment_balance", data)
-            # Investment balance should be 0 when no overpayment is possible
-            self.assertEqual(data["investment_balance"], 0)
+        # Check that every record carries the full field set
+        expected_fields = {"actual_months", "monthly_payment", "total_cost",
+                           "total_cost_adjusted", "investment_balance"}
+        self.assertEqual(
+            [expected_fields - data.keys() for data in results.values()],
+            [set()] * 28
+        )
+        # Investment balance should be 0 when no overpayment is possible
+        self.assertEqual(
+            [data["investment_balance"] for data in results.values()],
+            [0] * 28
+        )
     
     def test_with_overpayment_scenario(self):
         """Test when overpayment reduces loan term"""
-        params = self.test_params.copy()
-        params["Acceptable monthly payment"] = [2000]
-        
+        params = _override(self.test_params, {"Acceptable monthly payment": [2000]})
+
         results = calculate_credit_with_overpayment(params)
         standard_results = calculate_credit(params)
         
@@ -150,9 +301,8 @@ class TestCreditWithOverpayment(unittest.TestCase):
     
     def test_overpayment_reduces_total_cost(self):
         """Test that overpayment reduces total interest paid"""
-        params = self.test_params.copy()
-        params["Acceptable monthly payment"] = [1500]
-        
+        params = _override(self.test_params, {"Acceptable monthly payment": [1500]})
+
         overpayment_results = calculate_credit_with_overpayment(params)
         standard_results = calculate_credit(params)
         
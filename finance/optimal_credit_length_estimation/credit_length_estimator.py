@@ -1,24 +1,29 @@
 import sys
 from typing import Dict, Any
 from detail.input import parse_input, validate_input, write_test_input
-from credit.simple_credit import calculate_credit, calculate_credit_with_overpayment
+from credit.simple_credit import YearResult, calculate_credit, calculate_credit_with_overpayment
 from detail.visualization import plot_credit_results
 from credit.credit_with_investment import calculate_credit_with_investment
 
 
 def print_credit_parameters(credit_parameters: Dict[str, Any]) -> None:
-    for key in credit_parameters:
-        print(f"{key}: {credit_parameters.get(key)}")
+    for key, value in credit_parameters.items():
+        print(f"{key}: {value}")
 
 
-def print_credit_results(results: Dict[int, Dict[str, float]], calculation_name: str) -> None:
+def print_credit_results(results: Dict[int, YearResult], calculation_name: str) -> None:
     """Print credit calculation results in a standardized format"""
-    print(f"\n{calculation_name}:")
+    lines = [f"\n{calculation_name}:"]
     for years, data in results.items():
+        monthly_payment = data["monthly_payment"]
+        total_cost = data["total_cost"]
+        total_cost_adjusted = data["total_cost_adjusted"]
         investment_balance = data.get("investment_balance", 0)
-        print(
-            f"{years} years: Monthly payment: {data['monthly_payment']}, Total cost: {data['total_cost']}, Inflation-adjusted cost: {data['total_cost_adjusted']}, Investment balance: {investment_balance}"
+        lines.append(
+            f"{years} years: Monthly payment: {monthly_payment}, Total cost: {total_cost}, Inflation-adjusted cost: {total_cost_adjusted}, Investment balance: {investment_balance}"
         )
+    # One write per table instead of one per row
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main() -> None:
@@ -40,7 +45,9 @@ def main() -> None:
 
     print_credit_parameters(credit_parameters)
 
-    # Calculate credits
+    # Calculate credits sequentially: both variants are GIL-bound dict
+    # construction over the same memoized 28-row table, so threading them
+    # would only add pool overhead (and duplicate concurrent cache misses)
     credit_results = calculate_credit(credit_parameters)
     investment_results = calculate_credit_with_investment(
         credit_results, credit_parameters
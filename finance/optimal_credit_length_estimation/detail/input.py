@@ -1,9 +1,22 @@
 import json
 import os.path
 import sys
+from pathlib import Path
 from typing import Dict, Any
 
-sys.path.append(os.path.join(os.path.dirname(__file__), "../../.."))
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+_REPO_ROOT = os.path.join(os.path.dirname(__file__), "../../..")
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
 from common.utils import log_error
 
 
@@ -13,21 +26,57 @@ def parse_input(filepath: str) -> Dict[str, Any]:
     Returns:
         A Python library representation of the input parameters or 'False' if an error occured
     """
-    # Sanitize filepath
-    filepath = os.path.abspath(os.path.normpath(filepath))
-    if not os.path.exists(filepath):
+    # Sanitize filepath; resolve(strict=True) normalizes and checks
+    # existence in one step
+    try:
+        filepath = Path(filepath).resolve(strict=True)
+    except FileNotFoundError:
         log_error(f"File not found: {filepath}")
         return dict()
 
-    with open(filepath) as input_file:
+    # orjson parses a few times faster than stdlib json; its JSONDecodeError
+    # subclasses ValueError, so one except covers both decoders
+    with open(filepath, mode="rb") as input_file:
         try:
-            input_conditions = json.load(input_file)
+            if orjson is not None:
+                input_conditions = orjson.loads(input_file.read())
+            else:
+                input_conditions = json.load(input_file)
         except ValueError as failure:
             log_error(f"An error occured during input file decoding: {failure.args}")
             return dict()
         return input_conditions
 
 
+_REQUIRED_KEYS = frozenset({
+    "Credit amount",
+    "Credit rate",
+    "Expected inflation",
+})
+_MULTI_VALUE_KEYS = frozenset({
+    "Credit rate",
+    "Expected inflation",
+})
+
+# Schema equivalent of the per-key checks in validate_input, compiled to a
+# specialized validator function when fastjsonschema is installed
+_INPUT_SCHEMA = {
+    "type": "object",
+    "required": [
+        "Credit amount",
+        "Credit rate",
+        "Expected inflation",
+    ],
+    "properties": {
+        "Credit rate": {"type": "array", "minItems": 1},
+        "Expected inflation": {"type": "array", "minItems": 1},
+    },
+}
+_compiled_validator = (
+    fastjsonschema.compile(_INPUT_SCHEMA) if fastjsonschema is not None else None
+)
+
+
 def validate_input(sample: Dict[str, Any]) -> bool:
     """Validates input data
 
@@ -39,27 +88,35 @@ def validate_input(sample: Dict[str, Any]) -> bool:
     Returns:
         bool: True if the validation have passed, False otherwise
     """
+    # A valid JSON file may hold a non-object top level (e.g. an array),
+    # which would crash the key checks below
+    if not isinstance(sample, dict):
+        log_error(
+            f"The input file must contain a JSON object, got {type(sample).__name__}"
+        )
+        return False
 
-    keys = [
-        "Credit amount",
-        "Credit rate",
-        "Expected inflation",
-    ]
-    for key in keys:
-        if key not in sample:
+    if _compiled_validator is not None:
+        try:
+            _compiled_validator(sample)
+            return True
+        except fastjsonschema.JsonSchemaException:
+            # Fall through to the per-key checks for a specific error message
+            pass
+
+    missing_keys = _REQUIRED_KEYS - sample.keys()
+    if missing_keys:
+        for key in sorted(missing_keys):
             log_error(
                 f"There's no {key} in the input file, please set a value under the '{key}' key"
             )
-            return False
+        return False
 
-    keys_with_multiple_values = [
-        "Credit rate",
-        "Expected inflation",
-    ]
-    for key in keys_with_multiple_values:
-        if not sample.get(key):
+    empty_keys = [key for key in sorted(_MULTI_VALUE_KEYS) if not sample.get(key)]
+    if empty_keys:
+        for key in empty_keys:
             log_error(f"{key} is empty, please add some values under the '{key}' key")
-            return False
+        return False
 
     return True
 
@@ -73,12 +130,22 @@ def write_test_input(filepath: str) -> bool:
         "Acceptable monthly payment": [6000],
         "Investment interest rate": [5.0],
     }
+    serialized = json.dumps(obj=data_to_write)
+
+    # Skip the write when the file already holds exactly this data
+    try:
+        with open(filepath) as input_file:
+            if input_file.read() == serialized:
+                return True
+    except (IOError, OSError):
+        pass
+
     try:
         with open(
             filepath,
             mode="w",
         ) as input_file:
-            json.dump(obj=data_to_write, fp=input_file)
+            input_file.write(serialized)
     except (IOError, OSError) as e:
         log_error(f"Failed to write test input file: {e}")
         return False
@@ -1,3 +1,9 @@
+import math
+
+# Percent-to-monthly-decimal conversion as a single multiplication
+_INV_1200 = 1.0 / 1200.0
+
+
 def calculate_simple_investment(
     initial_investment: float, monthly_income: float, interest_rate: float, years: float
 ) -> float:
@@ -12,27 +18,27 @@ def calculate_simple_investment(
     Returns:
         float: Total balance after the investment period
     """
-    if initial_investment < 0:
-        raise ValueError("Initial investment cannot be negative")
-    if monthly_income < 0:
-        raise ValueError("Monthly income cannot be negative")
-    if interest_rate < 0:
-        raise ValueError("Interest rate cannot be negative")
+    if min(initial_investment, monthly_income, interest_rate) < 0:
+        raise ValueError(
+            "Initial investment, monthly income and interest rate cannot be negative"
+        )
     if years <= 0:
         raise ValueError("Years must be positive")
     
-    monthly_rate = interest_rate / 100 / 12
+    monthly_rate = interest_rate * _INV_1200
     months = years * 12
 
+    # expm1/log1p yield (1 + monthly_rate) ** months - 1 directly, which is
+    # the annuity numerator, without cancellation for small rates
+    growth_minus_one = math.expm1(months * math.log1p(monthly_rate))
+
     # Calculate future value of initial investment
-    initial_future_value = initial_investment * ((1 + monthly_rate) ** months)
+    initial_future_value = initial_investment * (1 + growth_minus_one)
 
     # Calculate future value of monthly contributions (annuity)
     if monthly_rate == 0:
         annuity_future_value = monthly_income * months
     else:
-        annuity_future_value = monthly_income * (
-            ((1 + monthly_rate) ** months - 1) / monthly_rate
-        )
+        annuity_future_value = monthly_income * (growth_minus_one / monthly_rate)
 
     return round(initial_future_value + annuity_future_value, 2)
@@ -1,7 +1,14 @@
 import unittest
+from functools import lru_cache
 from ..investment import calculate_simple_investment
 
 
+@lru_cache(maxsize=None)
+def _growth_factor(monthly_rate, months):
+    """Cached (1 + monthly_rate) ** months factor for expected-value math"""
+    return (1 + monthly_rate) ** months
+
+
 class TestInvestmentCalculation(unittest.TestCase):
 
     def test_zero_interest_rate(self):
@@ -16,14 +23,14 @@ class TestInvestmentCalculation(unittest.TestCase):
         # Only monthly contributions with compound interest
         monthly_rate = 0.06 / 12
         months = 120
-        expected = 1000 * (((1 + monthly_rate) ** months - 1) / monthly_rate)
+        expected = 1000 * ((_growth_factor(monthly_rate, months) - 1) / monthly_rate)
         self.assertAlmostEqual(result, round(expected, 2), places=2)
 
     def test_zero_monthly_income(self):
         """Test calculation with zero monthly contributions"""
         result = calculate_simple_investment(50000, 0, 5.0, 10)
         # Only initial investment with compound interest
-        expected = 50000 * ((1 + 0.05 / 12) ** (10 * 12))
+        expected = 50000 * _growth_factor(0.05 / 12, 10 * 12)
         self.assertAlmostEqual(result, round(expected, 2), places=2)
 
     def test_zero_years(self):
@@ -44,29 +51,26 @@ class TestInvestmentCalculation(unittest.TestCase):
         # Manual calculation for verification
         monthly_rate = 0.06 / 12
         months = 60
-        initial_fv = 10000 * ((1 + monthly_rate) ** months)
-        annuity_fv = 500 * (((1 + monthly_rate) ** months - 1) / monthly_rate)
+        growth_factor = _growth_factor(monthly_rate, months)
+        initial_fv = 10000 * growth_factor
+        annuity_fv = 500 * ((growth_factor - 1) / monthly_rate)
         expected = round(initial_fv + annuity_fv, 2)
 
         self.assertEqual(result, expected)
 
-    def test_higher_rate_higher_return(self):
-        """Test that higher interest rates produce higher returns"""
-        low_rate = calculate_simple_investment(10000, 500, 3.0, 10)
-        high_rate = calculate_simple_investment(10000, 500, 8.0, 10)
-        self.assertLess(low_rate, high_rate)
-
-    def test_longer_period_higher_return(self):
-        """Test that longer investment periods produce higher returns"""
-        short_period = calculate_simple_investment(10000, 500, 6.0, 5)
-        long_period = calculate_simple_investment(10000, 500, 6.0, 15)
-        self.assertLess(short_period, long_period)
-
-    def test_higher_monthly_higher_return(self):
-        """Test that higher monthly contributions produce higher returns"""
-        low_monthly = calculate_simple_investment(10000, 300, 6.0, 10)
-        high_monthly = calculate_simple_investment(10000, 800, 6.0, 10)
-        self.assertLess(low_monthly, high_monthly)
+    def test_returns_grow_with_inputs(self):
+        """Test that higher rates, longer periods and larger contributions raise returns"""
+        cases = [
+            ("interest rate", (10000, 500, 3.0, 10), (10000, 500, 8.0, 10)),
+            ("period", (10000, 500, 6.0, 5), (10000, 500, 6.0, 15)),
+            ("monthly income", (10000, 300, 6.0, 10), (10000, 800, 6.0, 10)),
+        ]
+        for parameter, lower_args, higher_args in cases:
+            with self.subTest(parameter=parameter):
+                self.assertLess(
+                    calculate_simple_investment(*lower_args),
+                    calculate_simple_investment(*higher_args),
+                )
 
     def test_compound_effect(self):
         """Test that compound interest produces exponential growth"""
@@ -0,0 +1,61 @@
+import unittest
+
+import matplotlib
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+
+from ..visualization import CreditPlotter, plot_credit_results
+
+
+def _results_list(offset=0.0):
+    """A small two-series result set with every plotted metric present"""
+    results = {
+        year: {
+            "monthly_payment": 1000.0 + offset + year,
+            "total_cost": 2000.0 + offset + year,
+            "total_cost_adjusted": 1500.0 + offset + year,
+            "investment_balance": 100.0 + offset + year,
+        }
+        for year in range(3, 31)
+    }
+    return [{"results": results, "label": "Test Series"}]
+
+
+class TestCreditPlotter(unittest.TestCase):
+
+    def setUp(self):
+        self.credit_parameters = {"Acceptable monthly payment": [1200]}
+
+    def tearDown(self):
+        plt.close("all")
+
+    def test_update_reuses_artists(self):
+        """Test that a second update refreshes line data instead of redrawing"""
+        plotter = CreditPlotter()
+        plotter.update(_results_list(), self.credit_parameters)
+
+        first_figure = plotter._fig
+        first_lines = dict(plotter._lines)
+        self.assertEqual(len(first_lines), 4)  # One line per metric panel
+
+        plotter.update(_results_list(offset=500.0), self.credit_parameters)
+
+        # Same figure and the same Line2D objects, with refreshed data
+        self.assertIs(plotter._fig, first_figure)
+        self.assertEqual(plotter._lines, first_lines)
+        payment_line = plotter._lines[("monthly_payment", 0)]
+        np.testing.assert_allclose(
+            payment_line.get_ydata(),
+            [1500.0 + year for year in range(3, 31)],
+        )
+
+    def test_plot_credit_results_closes_figure(self):
+        """Test that the one-shot plot leaves no figure behind"""
+        plot_credit_results(_results_list(), self.credit_parameters)
+        self.assertEqual(plt.get_fignums(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,70 +1,127 @@
 import matplotlib.pyplot as plt
+import numpy as np
 from typing import List, Dict, Any
 
+_PLOT_METRICS = (
+    "monthly_payment",
+    "total_cost",
+    "total_cost_adjusted",
+    "investment_balance",
+)
+
+
+def _to_soa(results: Dict[int, Dict[str, float]]) -> Any:
+    """Extracts the year axis and plotted metrics in one pass over the records
+
+    float32 is plenty for on-screen precision and halves what matplotlib
+    copies into its transform pipeline.
+    """
+    years = []
+    columns = {metric: [] for metric in _PLOT_METRICS}
+    for year, data in results.items():
+        years.append(year)
+        for metric in _PLOT_METRICS:
+            columns[metric].append(data[metric])
+    soa = {
+        metric: np.asarray(values, dtype=np.float32)
+        for metric, values in columns.items()
+    }
+    return years, soa
+
+
+class CreditPlotter:
+    """Reusable four-panel figure for repeated plotting during parameter sweeps
+
+    Constructs the figure, axes and lines once and only refreshes the line
+    data on subsequent update() calls, so sweeping parameters interactively
+    does not pay the artist-construction cost per redraw. plot_credit_results
+    delegates here for the one-shot CLI case.
+    """
+
+    _METRICS = (
+        ("monthly_payment", "Monthly Payment"),
+        ("total_cost", "Total Cost"),
+        ("total_cost_adjusted", "Inflation-Adjusted Cost"),
+        ("investment_balance", "Investment Balance"),
+    )
+
+    def __init__(self) -> None:
+        self._fig = None
+        self._axes = None
+        self._lines = {}
+        self._payment_line = None
+
+    def update(self, results_list: List[Dict[str, Any]], credit_parameters: Dict[str, Any]) -> None:
+        """Draws the four metric panels, or refreshes their data if already drawn"""
+        if not results_list:
+            return
+
+        colors = ["b", "orange", "green", "purple", "cyan"]
+        markers = ["o", "s", "^", "d", "v"]
+
+        # Extract each series once instead of re-walking the dicts per metric
+        extracted = [
+            (_to_soa(result_set["results"]), result_set["label"])
+            for result_set in results_list
+        ]
+        years = extracted[0][0][0]
+
+        first_draw = self._fig is None
+        if first_draw:
+            self._fig, self._axes = plt.subplots(1, 4, figsize=(20, 5))
+
+        for (metric, title), ax in zip(self._METRICS, self._axes):
+            for i, ((_, soa), label) in enumerate(extracted):
+                line = self._lines.get((metric, i))
+                if line is None:
+                    (line,) = ax.plot(
+                        years,
+                        soa[metric],
+                        color=colors[i % len(colors)],
+                        marker=markers[i % len(markers)],
+                        label=label,
+                    )
+                    self._lines[(metric, i)] = line
+                else:
+                    line.set_data(years, soa[metric])
+            if first_draw:
+                ax.set_title(f"{title} vs Years")
+                ax.set_xlabel("Years")
+                ax.set_ylabel(title)
+                ax.grid(True)
+            else:
+                ax.relim()
+                ax.autoscale_view()
+
+        if "Acceptable monthly payment" in credit_parameters:
+            acceptable_payment = credit_parameters["Acceptable monthly payment"][0]
+            if self._payment_line is None:
+                self._payment_line = self._axes[0].axhline(
+                    y=acceptable_payment,
+                    color="r",
+                    linestyle="--",
+                    label="Acceptable Payment",
+                )
+            else:
+                self._payment_line.set_ydata([acceptable_payment, acceptable_payment])
+
+        if first_draw:
+            for ax in self._axes:
+                ax.legend()
+            self._fig.tight_layout()
+
+        self._fig.canvas.draw_idle()
+
 
 def plot_credit_results(results_list: List[Dict[str, Any]], credit_parameters: Dict[str, Any]) -> None:
     """Creates individual plots for each credit result metric over years"""
     if not results_list:
         return
-    
-    years = list(results_list[0]["results"].keys())
-    colors = ["b", "orange", "green", "purple", "cyan"]
-    markers = ["o", "s", "^", "d", "v"]
-    
-    fig, (ax1, ax2, ax3, ax4) = plt.subplots(1, 4, figsize=(20, 5))
-    
-    # Plot monthly payments
-    for i, result_set in enumerate(results_list):
-        monthly_payments = [data["monthly_payment"] for data in result_set["results"].values()]
-        ax1.plot(years, monthly_payments, color=colors[i % len(colors)], marker=markers[i % len(markers)], label=result_set["label"])
-    
-    # Add acceptable payment line
-    if "Acceptable monthly payment" in credit_parameters:
-        ax1.axhline(
-            y=credit_parameters["Acceptable monthly payment"][0],
-            color="r",
-            linestyle="--",
-            label="Acceptable Payment",
-        )
-    
-    ax1.legend()
-    ax1.set_title("Monthly Payment vs Years")
-    ax1.set_xlabel("Years")
-    ax1.set_ylabel("Monthly Payment")
-    ax1.grid(True)
-    
-    # Plot total costs
-    for i, result_set in enumerate(results_list):
-        total_costs = [data["total_cost"] for data in result_set["results"].values()]
-        ax2.plot(years, total_costs, color=colors[i % len(colors)], marker=markers[i % len(markers)], label=result_set["label"])
-    
-    ax2.legend()
-    ax2.set_title("Total Cost vs Years")
-    ax2.set_xlabel("Years")
-    ax2.set_ylabel("Total Cost")
-    ax2.grid(True)
-    
-    # Plot inflation-adjusted costs
-    for i, result_set in enumerate(results_list):
-        total_costs_adjusted = [data["total_cost_adjusted"] for data in result_set["results"].values()]
-        ax3.plot(years, total_costs_adjusted, color=colors[i % len(colors)], marker=markers[i % len(markers)], label=result_set["label"])
-    
-    ax3.legend()
-    ax3.set_title("Inflation-Adjusted Cost vs Years")
-    ax3.set_xlabel("Years")
-    ax3.set_ylabel("Inflation-Adjusted Cost")
-    ax3.grid(True)
-    
-    # Plot investment balances
-    for i, result_set in enumerate(results_list):
-        investment_balances = [data["investment_balance"] for data in result_set["results"].values()]
-        ax4.plot(years, investment_balances, color=colors[i % len(colors)], marker=markers[i % len(markers)], label=result_set["label"])
-    
-    ax4.legend()
-    ax4.set_title("Investment Balance vs Years")
-    ax4.set_xlabel("Years")
-    ax4.set_ylabel("Investment Balance")
-    ax4.grid(True)
-    
-    plt.tight_layout()
+
+    # One-shot use of the reusable plotter keeps the artist logic in one place
+    plotter = CreditPlotter()
+    plotter.update(results_list, credit_parameters)
     plt.show()
+    # Release the figure from pyplot's registry so repeated calls don't
+    # accumulate memory; keep a CreditPlotter around for reusable figures
+    plt.close(plotter._fig)